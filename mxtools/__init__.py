@@ -7,4 +7,4 @@ del get_versions
 
 
 def print_now():
-    return datetime.datetime.strftime(datetime.datetime.now(), "%Y-%m-%d %H:%M:%S.%f")
+    return datetime.datetime.now().isoformat(sep=" ", timespec="microseconds")
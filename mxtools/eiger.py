@@ -1,12 +1,12 @@
+import copy
 import datetime
 import logging
 import os
 import time as ttime
-from collections import OrderedDict, deque
+from collections import deque
 from pathlib import PurePath
 from types import SimpleNamespace
 
-import h5py
 from ophyd import Component as Cpt
 from ophyd import Device, EpicsPathSignal, EpicsSignal, ImagePlugin, Signal, SingleTrigger
 from ophyd.areadetector import EigerDetector
@@ -28,8 +28,9 @@ EXTERNAL_ENABLE = 3
 
 class EigerSimulatedFilePlugin(Device, FileStoreBase):
     sequence_id = ADComponent(EpicsSignal, "SequenceId")
-    file_path = ADComponent(EpicsPathSignal, "FilePath", string=True, path_semantics="posix")
-    file_write_name_pattern = ADComponent(EpicsSignalWithRBV, "FWNamePattern", string=True)
+    # FilePath_RBV need not echo the written path, so set() waits on put completion instead
+    file_path = ADComponent(EpicsPathSignal, "FilePath", string=True, path_semantics="posix", put_complete=True)
+    file_write_name_pattern = ADComponent(EpicsSignalWithRBV, "FWNamePattern", string=True, put_complete=True)
     file_write_images_per_file = ADComponent(EpicsSignalWithRBV, "FWNImagesPerFile")
     current_run_start_uid = Cpt(Signal, value="", add_prefix=())
     enable = SimpleNamespace(get=lambda: True)
@@ -48,14 +49,13 @@ class EigerSimulatedFilePlugin(Device, FileStoreBase):
         print(f"{print_now()} staging detector {self.name}")
         res_uid = self.external_name.get()
         write_path = datetime.datetime.now().strftime(self.write_path_template)
-        self.file_path.set(f"{write_path}/")
-        self.file_write_name_pattern.set("{}_$id".format(res_uid))
+        st = self.file_path.set(f"{write_path}/") & self.file_write_name_pattern.set("{}_$id".format(res_uid))
+        st.wait(timeout=10)
         super().stage()
-        fn = PurePath(self.file_path.get()) / res_uid
-        ipf = int(self.file_write_images_per_file.get())  # noqa
+        fn = PurePath(write_path) / res_uid
         # logger.debug("Inserting resource with filename %s", fn)
         self._fn = fn
-        # res_kwargs = {"images_per_file": ipf}
+        # res_kwargs = {"images_per_file": int(self.file_write_images_per_file.get())}
         seq_id = int(self.sequence_id.get())  # det writes to the NEXT one
         res_kwargs = {"seq_id": seq_id}
         self._generate_resource(res_kwargs)
@@ -100,12 +100,20 @@ class EigerBaseV26(EigerDetector):
 
 
 class EigerSingleTriggerV26(SingleTrigger, EigerBaseV26):
+    # ophyd rebuilds stage_sigs per instance, these are applied on top of it
+    _default_stage_sigs = {
+        # "cam.trigger_mode": 0,  # original: single manual trigger
+        # "shutter_mode": 1,  # 'EPICS PV'
+        "cam.compression_algo": "BS LZ4",  # TODO is this useful? seems too late
+    }
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        # self.stage_sigs["cam.trigger_mode"] = 0 #original: single manual trigger
         self.stage_sigs.pop("cam.acquire")  # remove acquire=0
-        # self.stage_sigs['shutter_mode'] = 1  # 'EPICS PV'
-        self.stage_sigs.update({"cam.compression_algo": "BS LZ4"})  # TODO is this useful? seems too late
+        self.stage_sigs.update(self._default_stage_sigs)
+        # The trigger PV drops back to 0 once processed, so have set() track the
+        # put completion rather than waiting for the readback to match.
+        self.cam.special_trigger_button.put_complete = True
         self._asset_docs_cache = deque()
         self._resource_uids = []
         self._datum_counter = None
@@ -114,6 +122,7 @@ class EigerSingleTriggerV26(SingleTrigger, EigerBaseV26):
         self._master_metadata = []
 
         self._collection_dictionary = None
+        self._cached_stream_describe = None
 
     def read_configuration(self):
         return {}
@@ -227,20 +236,23 @@ class EigerSingleTriggerV26(SingleTrigger, EigerBaseV26):
         return tuple(asset_docs_cache)
 
     def _extract_metadata(self, field="omega"):
+        import h5py  # deferred: only needed once a run is collected
+
         with h5py.File(self._master_file, "r") as hf:
             return hf.get(f"entry/sample/goniometer/{field}")[()]
 
     def unstage(self):
         ttime.sleep(1.0)
+        self._cached_stream_describe = None
         super().unstage()
 
     def stage(self, *args, **kwargs):
+        self._cached_stream_describe = None
         return super().stage(*args, **kwargs)
 
     def trigger(self, *args, **kwargs):
         status = super().trigger(*args, **kwargs)
-        self.cam.special_trigger_button.set(1)
-        return status
+        return status & self.cam.special_trigger_button.set(1, timeout=10)
 
     def read(self, *args, streaming=False, **kwargs):
         """
@@ -258,7 +270,7 @@ class EigerSingleTriggerV26(SingleTrigger, EigerBaseV26):
         if streaming:
             key = self._image_name  # this comes from the SingleTrigger mixin
             read_dict = super().read()
-            ret = OrderedDict({key: read_dict[key]})
+            ret = {key: read_dict[key]}
             return ret
         else:
             ret = super().read(*args, **kwargs)
@@ -278,10 +290,14 @@ class EigerSingleTriggerV26(SingleTrigger, EigerBaseV26):
             whether to read streaming attrs or not
         """
         if streaming:
+            # the schema does not change between stage and unstage
+            if self._cached_stream_describe is not None:
+                return copy.deepcopy(self._cached_stream_describe)
             key = self._image_name  # this comes from the SingleTrigger mixin
             read_dict = super().describe()
-            ret = OrderedDict({key: read_dict[key]})
-            return ret
+            ret = {key: read_dict[key]}
+            self._cached_stream_describe = ret
+            return copy.deepcopy(ret)
         else:
             ret = super().describe(*args, **kwargs)
             return ret
@@ -1,13 +1,14 @@
+import functools
 import getpass
 import grp
 import logging
+import operator
 import os
 import time as ttime
 from collections import deque
 
-import h5py
 from ophyd.sim import NullStatus
-from ophyd.status import SubscriptionStatus
+from ophyd.status import Status, SubscriptionStatus
 
 from . import eiger
 
@@ -15,6 +16,37 @@ logger = logging.getLogger(__name__)
 DEFAULT_DATUM_DICT = {"data": None, "omega": None}
 
 
+# These never change within a process, so look them up (possibly via LDAP) only once.
+@functools.lru_cache(maxsize=1)
+def file_owner():
+    return getpass.getuser()
+
+
+@functools.lru_cache(maxsize=1)
+def file_owner_group():
+    return grp.getgrgid(os.getgid())[0]
+
+
+def _put_complete(signal, value):
+    """Put a value and return a Status finished by the CA put callback."""
+    status = Status(signal)
+    signal.put(value, use_complete=True, callback=lambda *args, **kwargs: status._finished())
+    return status
+
+
+def set_all(*args, timeout=30.0):
+    """Put several signals in parallel and wait until every put has completed.
+
+    Takes alternating signal/value pairs, like ``bps.mv``. Completion is tracked
+    through put callbacks rather than readback equality, since some readbacks
+    (e.g. FilePath_RBV or .PROC fields) never echo the written value.
+    """
+    if not args or len(args) % 2:
+        raise ValueError(f"set_all expects signal/value pairs, got {len(args)} arguments")
+    statuses = [_put_complete(signal, value) for signal, value in zip(args[::2], args[1::2])]
+    functools.reduce(operator.and_, statuses).wait(timeout)
+
+
 class MXFlyer:
     def __init__(self, vector, zebra, detector=None) -> None:
         self.name = "MXFlyer"
@@ -162,6 +194,8 @@ class MXFlyer:
         return tuple(asset_docs_cache)
 
     def _extract_metadata(self, field="omega"):
+        import h5py  # deferred: only needed once a run is collected
+
         with h5py.File(self._master_file, "r") as hf:
             return hf.get(f"entry/sample/goniometer/{field}")[()]
 
@@ -227,7 +261,7 @@ class MXFlyer:
         imgWidth = kwargs["img_width"]
         numImages = kwargs["num_images"]
         self.zebra_daq_prep()
-        ttime.sleep(0.5)
+        ttime.sleep(0.5)  # settle after zebra_daq_prep (done since LSDC 1); no ready PV to wait on
 
         PW = (exposurePeriodPerImage - detector_dead_time) * 1000
         PS = (exposurePeriodPerImage) * 1000
@@ -256,33 +290,53 @@ class MXFlyer:
         wavelength = kwargs["wavelength"]
         det_distance_m = kwargs["det_distance_m"]
 
-        self.detector.cam.save_files.put(1)
-        self.detector.cam.file_owner.put(getpass.getuser())
-        self.detector.cam.file_owner_grp.put(grp.getgrgid(os.getgid())[0])
-        self.detector.cam.file_perms.put(420)
-        file_prefix_minus_directory = str(file_prefix)
-        file_prefix_minus_directory = file_prefix_minus_directory.split("/")[-1]
-
-        self.detector.cam.acquire_time.put(exposure_per_image)
-        self.detector.cam.acquire_period.put(exposure_per_image)
-        self.detector.cam.trigger_mode.put(eiger.EXTERNAL_SERIES) # Trigger mode set before num_images due to updates in Eiger REST API
-        self.detector.cam.num_images.put(num_images)
-        self.detector.cam.num_triggers.put(1)
-        self.detector.cam.file_path.put(data_directory_name)
-        self.detector.cam.fw_name_pattern.put(f"{file_prefix_minus_directory}_$id")
-
-        self.detector.cam.sequence_id.put(file_number_start)
-
-        # originally from detector_set_fileheader
-        self.detector.cam.beam_center_x.put(x_beam)
-        self.detector.cam.beam_center_y.put(y_beam)
-        self.detector.cam.omega_incr.put(width)
-        self.detector.cam.omega_start.put(start)
-        self.detector.cam.wavelength.put(wavelength)
-        self.detector.cam.det_distance.put(det_distance_m)
-
-        self.detector.file.file_write_images_per_file.put(500)
-        
+        file_prefix_minus_directory = os.path.basename(str(file_prefix))
+
+        # Trigger mode set before num_images due to updates in Eiger REST API
+        set_all(
+            self.detector.cam.save_files,
+            1,
+            self.detector.cam.file_owner,
+            file_owner(),
+            self.detector.cam.file_owner_grp,
+            file_owner_group(),
+            self.detector.cam.file_perms,
+            420,
+            self.detector.cam.acquire_time,
+            exposure_per_image,
+            self.detector.cam.acquire_period,
+            exposure_per_image,
+            self.detector.cam.trigger_mode,
+            eiger.EXTERNAL_SERIES,
+        )
+        set_all(
+            self.detector.cam.num_images,
+            num_images,
+            self.detector.cam.num_triggers,
+            1,
+            self.detector.cam.file_path,
+            data_directory_name,
+            self.detector.cam.fw_name_pattern,
+            f"{file_prefix_minus_directory}_$id",
+            self.detector.cam.sequence_id,
+            file_number_start,
+            # originally from detector_set_fileheader
+            self.detector.cam.beam_center_x,
+            x_beam,
+            self.detector.cam.beam_center_y,
+            y_beam,
+            self.detector.cam.omega_incr,
+            width,
+            self.detector.cam.omega_start,
+            start,
+            self.detector.cam.wavelength,
+            wavelength,
+            self.detector.cam.det_distance,
+            det_distance_m,
+            self.detector.file.file_write_images_per_file,
+            500,
+        )
+
         start_arm = ttime.time()
 
         def armed_callback(value, old_value, **kwargs):
@@ -300,26 +354,46 @@ class MXFlyer:
     def setup_vector_program(
         self, num_images, angle_start, angle_end, x_um, y_um, z_um, exposure_period_per_image
     ):
-        self.vector.num_frames.put(num_images)
-        self.vector.start.omega.put(angle_start)
-        self.vector.end.omega.put(angle_end)
-        self.vector.start.x.put(x_um[0])
-        self.vector.end.x.put(x_um[1])
-        self.vector.start.y.put(y_um[0])
-        self.vector.end.y.put(y_um[1])
-        self.vector.start.z.put(z_um[0])
-        self.vector.end.z.put(z_um[1])
-        self.vector.frame_exptime.put(exposure_period_per_image * 1000.0)
-        self.vector.hold.put(0)
+        set_all(
+            self.vector.num_frames,
+            num_images,
+            self.vector.start.omega,
+            angle_start,
+            self.vector.end.omega,
+            angle_end,
+            self.vector.start.x,
+            x_um[0],
+            self.vector.end.x,
+            x_um[1],
+            self.vector.start.y,
+            y_um[0],
+            self.vector.end.y,
+            y_um[1],
+            self.vector.start.z,
+            z_um[0],
+            self.vector.end.z,
+            z_um[1],
+            self.vector.frame_exptime,
+            exposure_period_per_image * 1000.0,
+            self.vector.hold,
+            0,
+        )
 
     def zebra_daq_prep(self):
-        self.zebra.reset.put(1)
-        ttime.sleep(0.5)  # not known why this sleep is so long (done since LSDC 1)
-        self.zebra.out1.put(31)
-        self.zebra.m1_set_pos.put(1)
-        self.zebra.m2_set_pos.put(1)
-        self.zebra.m3_set_pos.put(1)
-        self.zebra.pc.arm.trig_source.put(1)
+        self.zebra.reset.put(1, wait=True)  # only confirms the record processed, not hardware readiness
+        ttime.sleep(0.5)  # not known why this sleep is so long (done since LSDC 1); no reset-done PV
+        set_all(
+            self.zebra.out1,
+            31,
+            self.zebra.m1_set_pos,
+            1,
+            self.zebra.m2_set_pos,
+            1,
+            self.zebra.m3_set_pos,
+            1,
+            self.zebra.pc.arm.trig_source,
+            1,
+        )
 
     # expected zebra setup:
     #     time in ms
@@ -337,13 +411,22 @@ class MXFlyer:
         num_images,
         is_still=False,
     ):
-        self.zebra.pc.gate.start.put(angle_start, wait=True)
+        pulse_delay = exposure_period_per_image * 500
+        gate_and_pulse = [self.zebra.pc.gate.start, angle_start]
         if is_still is False:
-            self.zebra.pc.gate.width.put(gate_width, wait=True)
-            self.zebra.pc.gate.step.put(scan_width, wait=True)
-        self.zebra.pc.gate.num_gates.put(1, wait=True)
-        self.zebra.pc.pulse.start.put(0, wait=True)
-        self.zebra.pc.pulse.width.put(pulse_width, wait=True)
-        self.zebra.pc.pulse.step.put(pulse_step, wait=True)
-        self.zebra.pc.pulse.delay.put(exposure_period_per_image / 2 * 1000, wait=True)
-        self.zebra.pc.pulse.max.put(num_images, wait=True)
+            gate_and_pulse += [self.zebra.pc.gate.width, gate_width, self.zebra.pc.gate.step, scan_width]
+        gate_and_pulse += [
+            self.zebra.pc.gate.num_gates,
+            1,
+            self.zebra.pc.pulse.start,
+            0,
+            self.zebra.pc.pulse.width,
+            pulse_width,
+            self.zebra.pc.pulse.step,
+            pulse_step,
+            self.zebra.pc.pulse.delay,
+            pulse_delay,
+            self.zebra.pc.pulse.max,
+            num_images,
+        ]
+        set_all(*gate_and_pulse)
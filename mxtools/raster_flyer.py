@@ -1,5 +1,3 @@
-import getpass
-import grp
 import logging
 import os
 import time as ttime
@@ -8,7 +6,7 @@ from ophyd.sim import NullStatus
 from ophyd.status import SubscriptionStatus
 
 from . import eiger
-from .flyer import MXFlyer
+from .flyer import MXFlyer, file_owner, file_owner_group, set_all
 
 logger = logging.getLogger(__name__)
 
@@ -51,7 +49,7 @@ class MXRasterFlyer(MXFlyer):
         numImages = kwargs["num_images"]
         self.zebra_daq_prep()
         self.zebra.pc.encoder.put(3)  # encoder 0=x, 1=y,2=z,3=omega
-        ttime.sleep(0.5)  # used since LSDC 1 - reason unknown
+        ttime.sleep(0.5)  # used since LSDC 1 - reason unknown; no ready PV to wait on
         self.zebra.pc.direction.put(0)  # direction 0 = positive
         self.zebra.pc.gate.sel.put(0)
         self.zebra.pc.pulse.sel.put(1)
@@ -87,23 +85,32 @@ class MXRasterFlyer(MXFlyer):
         num_images,
         is_still=False,
     ):
-        self.zebra.pc.gate.start.put(angle_start, wait=True)
+        pulse_delay = exposure_period_per_image * 500
+        gate_and_pulse = [self.zebra.pc.gate.start, angle_start]
         if is_still is False:
             logger.debug(f"before: gate width: {gate_width} gate step: {scan_width}")
-            self.zebra.pc.gate.width.put(gate_width, wait=True)
-            self.zebra.pc.gate.step.put(scan_width, wait=True)
-        self.zebra.pc.gate.num_gates.put(1, wait=True)
-        self.zebra.pc.pulse.start.put(0, wait=True)
+            gate_and_pulse += [self.zebra.pc.gate.width, gate_width, self.zebra.pc.gate.step, scan_width]
+        gate_and_pulse += [
+            self.zebra.pc.gate.num_gates,
+            1,
+            self.zebra.pc.pulse.start,
+            0,
+            self.zebra.pc.pulse.width,
+            pulse_width,
+            self.zebra.pc.pulse.step,
+            pulse_step,
+            self.zebra.pc.pulse.delay,
+            pulse_delay,
+            self.zebra.pc.pulse.max,
+            num_images,
+        ]
         logger.debug(f"before: pulse width: {pulse_width}")
-        self.zebra.pc.pulse.width.put(pulse_width, wait=True)
-        self.zebra.pc.pulse.step.put(pulse_step, wait=True)
-        logger.debug(f"before: pulse delay: {exposure_period_per_image / 2 * 1000}")
-        self.zebra.pc.pulse.delay.put(exposure_period_per_image / 2 * 1000, wait=True)
+        logger.debug(f"before: pulse delay: {pulse_delay}")
+        set_all(*gate_and_pulse)
         logger.debug(
             f"after: gate width: {self.zebra.pc.gate.width.get()} gate step: {self.zebra.pc.gate.step.get()}"
             f"after: pulse width: {self.zebra.pc.pulse.width.get()} pulse delay: {self.zebra.pc.pulse.delay.get()}"
         )
-        self.zebra.pc.pulse.max.put(num_images, wait=True)
         self.vector.hold.put(0)  # necessary to prevent problems upon
         # exposure time change
 
@@ -121,31 +128,50 @@ class MXRasterFlyer(MXFlyer):
         det_distance_m = kwargs["det_distance_m"]
         num_images_per_file = kwargs["num_images_per_file"]
 
-        self.detector.cam.save_files.put(1)
-        self.detector.cam.file_owner.put(getpass.getuser())
-        self.detector.cam.file_owner_grp.put(grp.getgrgid(os.getgid())[0])
-        self.detector.cam.file_perms.put(420)
-        file_prefix_minus_directory = str(file_prefix)
-        file_prefix_minus_directory = file_prefix_minus_directory.split("/")[-1]
-
-        self.detector.cam.acquire_time.put(exposure_per_image)
-        self.detector.cam.acquire_period.put(exposure_per_image)
-        self.detector.cam.trigger_mode.put(eiger.EXTERNAL_ENABLE) # Setting trigger mode before num_triggers due to change in Eiger REST API change
-        self.detector.cam.num_triggers.put(total_num_images)
-        self.detector.cam.file_path.put(data_directory_name)
-        self.detector.cam.fw_name_pattern.put(f"{file_prefix_minus_directory}_$id")
-
-        self.detector.cam.sequence_id.put(file_number_start)
-
-        # originally from detector_set_fileheader
-        self.detector.cam.beam_center_x.put(x_beam)
-        self.detector.cam.beam_center_y.put(y_beam)
-        self.detector.cam.omega_incr.put(width)
-        self.detector.cam.omega_start.put(start)
-        self.detector.cam.wavelength.put(wavelength)
-        self.detector.cam.det_distance.put(det_distance_m)
-
-        self.detector.file.file_write_images_per_file.put(num_images_per_file)
+        file_prefix_minus_directory = os.path.basename(str(file_prefix))
+
+        # Setting trigger mode before num_triggers due to change in Eiger REST API change
+        set_all(
+            self.detector.cam.save_files,
+            1,
+            self.detector.cam.file_owner,
+            file_owner(),
+            self.detector.cam.file_owner_grp,
+            file_owner_group(),
+            self.detector.cam.file_perms,
+            420,
+            self.detector.cam.acquire_time,
+            exposure_per_image,
+            self.detector.cam.acquire_period,
+            exposure_per_image,
+            self.detector.cam.trigger_mode,
+            eiger.EXTERNAL_ENABLE,
+        )
+        set_all(
+            self.detector.cam.num_triggers,
+            total_num_images,
+            self.detector.cam.file_path,
+            data_directory_name,
+            self.detector.cam.fw_name_pattern,
+            f"{file_prefix_minus_directory}_$id",
+            self.detector.cam.sequence_id,
+            file_number_start,
+            # originally from detector_set_fileheader
+            self.detector.cam.beam_center_x,
+            x_beam,
+            self.detector.cam.beam_center_y,
+            y_beam,
+            self.detector.cam.omega_incr,
+            width,
+            self.detector.cam.omega_start,
+            start,
+            self.detector.cam.wavelength,
+            wavelength,
+            self.detector.cam.det_distance,
+            det_distance_m,
+            self.detector.file.file_write_images_per_file,
+            num_images_per_file,
+        )
 
         start_arm = ttime.time()
 
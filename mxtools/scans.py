@@ -15,18 +15,23 @@ def setup_zebra_vector_scan_for_raster(
     num_images,
     scan_encoder=3,
 ):
+    delay_ms = exposure_period_per_image * 500
+    period_ms = exposure_period_per_image * 1000
+    exp_ms = (exposure_time_per_image - detector_dead_time) * 1000
+
     yield from bps.mv(zebra.pc.encoder, scan_encoder)
+    # bps.mv only confirms the write; there is no ready PV for the encoder change
     yield from bps.sleep(1.0)
     yield from bps.mv(zebra.pc.direction, 0, zebra.pc.gate.sel, 0)  # direction, 0 = positive
-    yield from bps.mv(zebra.pc.gate.start, angle_start)
+    gate_and_pulse = [zebra.pc.gate.start, angle_start]
     if image_width != 0:
-        yield from bps.mv(
+        gate_and_pulse += [
             zebra.pc.gate.width,
             num_images * image_width,
             zebra.pc.gate.step,
             num_images * image_width + 0.01,
-        )
-    yield from bps.mv(
+        ]
+    gate_and_pulse += [
         zebra.pc.gate.num_gates,
         1,
         zebra.pc.pulse.sel,
@@ -34,28 +39,29 @@ def setup_zebra_vector_scan_for_raster(
         zebra.pc.pulse.start,
         0,
         zebra.pc.pulse.width,
-        (exposure_time_per_image - detector_dead_time) * 1000,
+        exp_ms,
         zebra.pc.pulse.step,
-        exposure_period_per_image * 1000,
+        period_ms,
         zebra.pc.pulse.delay,
-        exposure_period_per_image / 2 * 1000,
-    )
+        delay_ms,
+    ]
+    yield from bps.mv(*gate_and_pulse)
 
 
 def setup_eiger_exposure(eiger, exposure_time, exposure_period):
-    yield from bps.mv(eiger.cam.acquire_time(exposure_time))
-    yield from bps.mv(eiger.cam.acquire_period(exposure_period))
+    yield from bps.mv(eiger.cam.acquire_time, exposure_time, eiger.cam.acquire_period, exposure_period)
 
 
 def setup_eiger_triggers(eiger, mode, num_triggers, exposure_per_image):
+    # trigger mode must be set before num_triggers due to the Eiger REST API
     yield from bps.mv(eiger.cam.trigger_mode, mode)
-    yield from bps.mv(eiger.cam.num_triggers, num_triggers)
-    yield from bps.mv(eiger.cam.trigger_exposure, exposure_per_image)
+    yield from bps.mv(eiger.cam.num_triggers, num_triggers, eiger.cam.trigger_exposure, exposure_per_image)
 
 
 def setup_eiger_stop_acquire_and_wait(eiger):
+    # acquire is an EpicsSignalWithRBV, so the move only completes once
+    # Acquire_RBV equals 0.
     yield from bps.mv(eiger.cam.acquire, 0)
-    # wait until Acquire_RBV is 0
 
 
 # NOTE: BELOW IS NOW OBSOLETE BUT KEPT FOR ARCHIVAL DOCUMENTATION